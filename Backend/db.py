@@ -1,6 +1,18 @@
 # db.py
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql import functions
+from routing import RoutingSession
 
 # Just create the 'db' object.
 # We will attach it to our Flask app in the 'app.py' file.
-db = SQLAlchemy()
\ No newline at end of file
+# RoutingSession sends read-only requests to replicas when any are configured.
+db = SQLAlchemy(session_options={"class_": RoutingSession})
+
+# SQLite keeps DateTime columns as text and compares them as strings. Its
+# CURRENT_TIMESTAMP ('2024-01-01 12:00:00') sorts before the format SQLAlchemy
+# binds ('2024-01-01 12:00:00.000000'), so rows stamped by the database clock
+# would miss cursors taken in the same second. Stamp in the bound format instead.
+@compiles(functions.now, 'sqlite')
+def _sqlite_now(element, compiler, **kw):
+    return "strftime('%Y-%m-%d %H:%M:%f000', 'now')"
@@ -0,0 +1,151 @@
+# duplicates.py
+import hashlib
+from urllib.parse import urlsplit, parse_qsl, urlencode
+from sqlalchemy.sql import func
+from db import db
+from models import Company, JobApplication
+
+BACKFILL_BATCH_SIZE = 1000
+
+# Query parameters that only identify where a click came from, never the posting
+TRACKING_PARAMS = {
+    'gclid', 'fbclid', 'msclkid', 'mc_cid', 'mc_eid', 'ref', 'refid', 'referrer', 'src', 'source',
+    'trk', 'trkinfo', 'trackingid', 'tracking_id', 'lipi', 'gh_src', 'lever-source', 'lever-origin',
+}
+
+# ==========================================
+#  NORMALIZATION
+# ==========================================
+
+def normalize_job_url(url):
+    """Reduce a posting URL to the parts that identify the posting.
+
+    http/https and `www.` are treated alike, default ports, fragments,
+    tracking parameters (utm_*, gclid, ...) and trailing slashes are
+    dropped, and the remaining query parameters are sorted. Route-like
+    fragments (`#/jobs/123`, `#!/job/123`) are kept, since hash-routed career
+    sites put the posting id there. Path case is kept because many job
+    boards use case-sensitive ids. Text that doesn't
+    parse as a URL (bad port, unbalanced brackets) is compared as typed.
+    """
+    if not url or not url.strip():
+        return None
+    url = raw = url.strip()
+    if '://' not in url:
+        url = 'https://' + url
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return raw
+    host = (parts.hostname or '').lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    if port and port not in (80, 443):
+        host = f"{host}:{port}"
+    path = '/'.join(segment for segment in parts.path.split('/') if segment)
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith('utm_') and key.lower() not in TRACKING_PARAMS
+    )
+    route = parts.fragment.rstrip('/') if parts.fragment.startswith(('/', '!')) else ''
+    normalized = f"{host}/{path}" if path else host
+    if query:
+        normalized = f"{normalized}?{urlencode(query)}"
+    return f"{normalized}#{route}" if route.strip('!/') else normalized
+
+def job_url_hash(user_id, url):
+    """Hash of the normalized URL, scoped to its owner.
+
+    Mixing the user id in makes the single-column index on `job_url_hash`
+    a per-user index: a lookup only ever matches that user's rows, however
+    many people saved the same popular posting.
+    """
+    normalized = normalize_job_url(url)
+    if normalized is None:
+        return None
+    return hashlib.sha256(f"{user_id}:{normalized}".encode('utf-8')).hexdigest()
+
+# ==========================================
+#  LOOKUP
+# ==========================================
+
+def find_duplicates(user_id, url_hash, exclude_id=None):
+    """The user's applications already saved under the same normalized URL (one index probe)"""
+    if url_hash is None:
+        return []
+    query = JobApplication.query.join(Company).filter(
+        JobApplication.job_url_hash == url_hash,
+        Company.user_id == user_id
+    )
+    if exclude_id is not None:
+        query = query.filter(JobApplication.id != exclude_id)
+    return query.order_by(JobApplication.id).all()
+
+def duplicate_groups(user_id=None):
+    """Ids of applications sharing a normalized URL, as lists ordered oldest first.
+
+    One GROUP BY over the hash column finds every group in a single pass,
+    without comparing applications pairwise. Hashes are already per-user,
+    so each group belongs to exactly one user.
+    """
+    query = db.session.query(JobApplication.job_url_hash).filter(JobApplication.job_url_hash.isnot(None))
+    if user_id is not None:
+        query = query.join(Company).filter(Company.user_id == user_id)
+    dup_hashes = query.group_by(JobApplication.job_url_hash).having(func.count(JobApplication.id) > 1).subquery()
+
+    groups = {}
+    rows = (db.session.query(JobApplication.job_url_hash, JobApplication.id)
+            .filter(JobApplication.job_url_hash.in_(db.select(dup_hashes.c.job_url_hash)))
+            .order_by(JobApplication.job_url_hash, JobApplication.id))
+    for url_hash, app_id in rows:
+        groups.setdefault(url_hash, []).append(app_id)
+    return list(groups.values())
+
+# ==========================================
+#  MERGE & BACKFILL
+# ==========================================
+
+def merge_applications(keeper, duplicates):
+    """Fold `duplicates` into `keeper` and delete them. The caller commits.
+
+    Resumes move to the keeper, notes are appended, and fields the keeper
+    left empty are filled from the duplicates.
+    """
+    for dup in duplicates:
+        for resume in list(dup.resumes):
+            dup.resumes.remove(resume)
+            keeper.resumes.append(resume)
+        if dup.notes and dup.notes not in (keeper.notes or ''):
+            keeper.notes = f"{keeper.notes}\n\n{dup.notes}" if keeper.notes else dup.notes
+        keeper.application_date = keeper.application_date or dup.application_date
+        if not keeper.job_url and dup.job_url:
+            keeper.job_url = dup.job_url
+            keeper.job_url_hash = job_url_hash(keeper.company.user_id, keeper.job_url)
+        if dup.follow_up_at and not dup.follow_up_done and (
+                keeper.follow_up_at is None or keeper.follow_up_done or dup.follow_up_at < keeper.follow_up_at):
+            keeper.follow_up_at, keeper.follow_up_done = dup.follow_up_at, False
+        if keeper.status in (None, 'To Apply') and dup.status:
+            keeper.status = dup.status
+        db.session.delete(dup)
+    return keeper
+
+def backfill_hashes(batch_size=BACKFILL_BATCH_SIZE):
+    """Compute `job_url_hash` for rows saved before the column existed.
+
+    URLs with a fragment are rehashed too, as route-like fragments used to
+    be dropped; rows whose hash doesn't change aren't written.
+    """
+    last_id, total = 0, 0
+    while True:
+        rows = (db.session.query(JobApplication, Company.user_id).join(Company)
+                .filter(JobApplication.id > last_id, JobApplication.job_url.isnot(None),
+                        db.or_(JobApplication.job_url_hash.is_(None), JobApplication.job_url.contains('#')))
+                .order_by(JobApplication.id).limit(batch_size).all())
+        if not rows:
+            return total
+        for application, user_id in rows:
+            application.job_url_hash = job_url_hash(user_id, application.job_url)
+        db.session.commit()
+        total += len(rows)
+        last_id = rows[-1][0].id
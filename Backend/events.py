@@ -0,0 +1,167 @@
+# events.py
+import os
+import json
+import queue
+import select
+import logging
+import threading
+from sqlalchemy import text
+
+logger = logging.getLogger('events')
+
+CHANNEL = 'admin_events'
+HEARTBEAT_SECONDS = 15
+MAX_STREAMS = int(os.getenv('ADMIN_SSE_MAX_STREAMS', 10))
+SUBSCRIBER_QUEUE_SIZE = 200
+
+# Postgres rejects NOTIFY payloads over 8000 bytes
+_MAX_DETAILS = 1000
+
+
+def format_sse(event, data, event_id=None):
+    """Render one Server-Sent Events frame"""
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data)}")
+    return "\n".join(lines) + "\n\n"
+
+
+class Subscription:
+    def __init__(self, broker):
+        self.broker = broker
+        self.queue = queue.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self.closed = False
+
+    def get(self, timeout):
+        return self.queue.get(timeout=timeout)
+
+    def close(self):
+        self.broker.unsubscribe(self)
+
+
+class Broker:
+    """Fans admin events out to every open dashboard stream in this process.
+
+    On Postgres a single background thread LISTENs on `admin_events` and feeds
+    all subscribers, so events raised by any gunicorn worker reach every tab
+    while the database only ever sees one listener per process. Elsewhere
+    (SQLite in local dev) events are delivered in-process only.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = set()
+        self._listener = None
+        self._engine = None
+        # Set while the LISTEN connection is live; new streams wait on it before
+        # reading their backlog so nothing committed in between is missed.
+        self._listening = threading.Event()
+
+    def init_app(self, app, engine):
+        self._engine = engine
+        app.extensions['admin_events'] = self
+
+    @property
+    def uses_listen_notify(self):
+        return self._engine is not None and self._engine.dialect.name == 'postgresql'
+
+    def subscribe(self):
+        """Returns a Subscription, or None when the stream cap is reached"""
+        with self._lock:
+            if len(self._subscribers) >= MAX_STREAMS:
+                return None
+            sub = Subscription(self)
+            self._subscribers.add(sub)
+            if self.uses_listen_notify and (self._listener is None or not self._listener.is_alive()):
+                self._listener = threading.Thread(target=self._listen, name='admin-events-listener', daemon=True)
+                self._listener.start()
+            return sub
+
+    def wait_until_listening(self, timeout):
+        """True once events published from now on are guaranteed to be delivered"""
+        if not self.uses_listen_notify:
+            return True
+        return self._listening.wait(timeout)
+
+    def unsubscribe(self, sub):
+        with self._lock:
+            sub.closed = True
+            self._subscribers.discard(sub)
+
+    def publish(self, event, data, event_id=None):
+        """Send an event to every dashboard. Call after the related commit."""
+        if isinstance(data.get('details'), str) and len(data['details']) > _MAX_DETAILS:
+            data = dict(data, details=data['details'][:_MAX_DETAILS] + '…')
+        message = {"event": event, "data": data, "id": event_id}
+        if not self.uses_listen_notify:
+            self._fan_out(message)
+            return
+        try:
+            with self._engine.connect() as conn:
+                conn.execute(text("SELECT pg_notify(:channel, :payload)"),
+                             {"channel": CHANNEL, "payload": json.dumps(message)})
+                conn.commit()
+        except Exception as e:
+            logger.warning("Event publish failed: %s", e)
+
+    def _fan_out(self, message):
+        frame = format_sse(message['event'], message['data'], message.get('id'))
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for sub in subscribers:
+            try:
+                sub.queue.put_nowait(frame)
+            except queue.Full:
+                # A stalled client must not hold events for everybody else;
+                # dropping it makes the browser reconnect with Last-Event-ID.
+                self.unsubscribe(sub)
+
+    def _listen(self):
+        """One LISTEN connection per process; exits once nobody is subscribed"""
+        backoff = 1
+        while True:
+            with self._lock:
+                if not self._subscribers:
+                    self._listener = None
+                    return
+            raw = None
+            try:
+                raw = self._engine.raw_connection()
+                raw.detach()  # keep this long-lived connection out of the pool
+                pg = raw.driver_connection
+                pg.autocommit = True
+                pg.cursor().execute(f"LISTEN {CHANNEL};")
+                self._listening.set()
+                backoff = 1
+                while True:
+                    with self._lock:
+                        if not self._subscribers:
+                            self._listening.clear()
+                            break
+                    if select.select([pg], [], [], HEARTBEAT_SECONDS) == ([], [], []):
+                        continue
+                    pg.poll()
+                    while pg.notifies:
+                        notify = pg.notifies.pop(0)
+                        self._fan_out(json.loads(notify.payload))
+            except Exception as e:
+                logger.warning("Admin event listener error, reconnecting in %ss: %s", backoff, e)
+                # Notifications sent while we were disconnected are gone; close the
+                # streams so browsers reconnect and replay them via Last-Event-ID.
+                with self._lock:
+                    self._listening.clear()
+                    for sub in self._subscribers:
+                        sub.closed = True
+                    self._subscribers.clear()
+                threading.Event().wait(backoff)
+                backoff = min(backoff * 2, 30)
+            finally:
+                if raw is not None:
+                    try:
+                        raw.close()
+                    except Exception:
+                        pass
+
+
+broker = Broker()
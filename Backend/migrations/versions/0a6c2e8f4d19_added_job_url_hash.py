@@ -0,0 +1,30 @@
+"""Added job_url_hash for duplicate application detection
+
+Revision ID: 0a6c2e8f4d19
+Revises: f1b9d3e5a724
+Create Date: 2026-10-19 18:45:09.660342
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0a6c2e8f4d19'
+down_revision = 'f1b9d3e5a724'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('job_application', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('job_url_hash', sa.String(length=64), nullable=True))
+        batch_op.create_index(batch_op.f('ix_job_application_job_url_hash'), ['job_url_hash'], unique=False)
+
+    # Existing rows are hashed by `flask dedupe-applications`
+
+
+def downgrade():
+    with op.batch_alter_table('job_application', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_job_application_job_url_hash'))
+        batch_op.drop_column('job_url_hash')
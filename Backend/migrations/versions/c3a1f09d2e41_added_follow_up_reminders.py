@@ -0,0 +1,62 @@
+"""Added follow-up reminders and notification inbox
+
+Revision ID: c3a1f09d2e41
+Revises: b47874ef815c
+Create Date: 2026-10-19 09:12:31.402117
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c3a1f09d2e41'
+down_revision = 'b47874ef815c'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('job_application', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('follow_up_at', sa.DateTime(), nullable=True))
+        batch_op.add_column(sa.Column('follow_up_done', sa.Boolean(), server_default=sa.false(), nullable=False))
+
+    # Partial index: only pending follow-ups are indexed, so the scheduler's
+    # due-item scan stays small regardless of table size.
+    op.create_index(
+        'ix_job_application_follow_up_due', 'job_application', ['follow_up_at'], unique=False,
+        postgresql_where=sa.text('follow_up_at IS NOT NULL AND follow_up_done = false'),
+        sqlite_where=sa.text('follow_up_at IS NOT NULL AND follow_up_done = 0')
+    )
+    op.create_index(
+        'ix_job_application_company_follow_up_due', 'job_application', ['company_id', 'follow_up_at'], unique=False,
+        postgresql_where=sa.text('follow_up_at IS NOT NULL AND follow_up_done = false'),
+        sqlite_where=sa.text('follow_up_at IS NOT NULL AND follow_up_done = 0')
+    )
+
+    op.create_table('notification',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('application_id', sa.Integer(), nullable=True),
+    sa.Column('message', sa.Text(), nullable=False),
+    sa.Column('is_read', sa.Boolean(), server_default=sa.false(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['application_id'], ['job_application.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('notification', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_notification_user_id'), ['user_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('notification', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_notification_user_id'))
+
+    op.drop_table('notification')
+    op.drop_index('ix_job_application_company_follow_up_due', table_name='job_application')
+    op.drop_index('ix_job_application_follow_up_due', table_name='job_application')
+
+    with op.batch_alter_table('job_application', schema=None) as batch_op:
+        batch_op.drop_column('follow_up_done')
+        batch_op.drop_column('follow_up_at')
@@ -0,0 +1,79 @@
+"""Added created_at/updated_at tracking and deleted_record tombstones
+
+Revision ID: d5e7a2b4c913
+Revises: c3a1f09d2e41
+Create Date: 2026-10-19 11:40:05.918230
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd5e7a2b4c913'
+down_revision = 'c3a1f09d2e41'
+branch_labels = None
+depends_on = None
+
+# table name -> column the (owner, updated_at) index leads with
+SYNCED_TABLES = {
+    'company': 'user_id',
+    'job_application': 'company_id',
+    'contact': 'company_id',
+    'resume': 'application_id',
+}
+
+
+def upgrade():
+    for table, owner_column in SYNCED_TABLES.items():
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.add_column(sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True))
+            batch_op.add_column(sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True))
+            batch_op.create_index(f'ix_{table}_{owner_column}_updated_at', [owner_column, 'updated_at'], unique=False)
+
+    op.create_table('deleted_record',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('entity_type', sa.String(length=30), nullable=False),
+    sa.Column('entity_id', sa.Integer(), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('deleted_record', schema=None) as batch_op:
+        batch_op.create_index('ix_deleted_record_user_id_deleted_at', ['user_id', 'deleted_at'], unique=False)
+
+    # Let Postgres own updated_at so writes that bypass the ORM are tracked too
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute("""
+            CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+            BEGIN
+                NEW.updated_at = now();
+                RETURN NEW;
+            END;
+            $$ LANGUAGE plpgsql;
+        """)
+        for table in SYNCED_TABLES:
+            op.execute(f"""
+                CREATE TRIGGER trg_{table}_updated_at
+                BEFORE UPDATE ON {table}
+                FOR EACH ROW EXECUTE FUNCTION set_updated_at();
+            """)
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        for table in SYNCED_TABLES:
+            op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_updated_at ON {table};")
+        op.execute("DROP FUNCTION IF EXISTS set_updated_at();")
+
+    with op.batch_alter_table('deleted_record', schema=None) as batch_op:
+        batch_op.drop_index('ix_deleted_record_user_id_deleted_at')
+
+    op.drop_table('deleted_record')
+
+    for table, owner_column in SYNCED_TABLES.items():
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.drop_index(f'ix_{table}_{owner_column}_updated_at')
+            batch_op.drop_column('updated_at')
+            batch_op.drop_column('created_at')
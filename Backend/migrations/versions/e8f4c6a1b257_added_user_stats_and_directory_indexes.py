@@ -0,0 +1,75 @@
+"""Added user_stats table and admin directory indexes
+
+Revision ID: e8f4c6a1b257
+Revises: d5e7a2b4c913
+Create Date: 2026-10-19 14:03:52.227816
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e8f4c6a1b257'
+down_revision = 'd5e7a2b4c913'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('user_stats',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('company_count', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('application_count', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('actions_30d', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('last_login_at', sa.DateTime(), nullable=True),
+    sa.Column('reconciled_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id')
+    )
+    with op.batch_alter_table('user_stats', schema=None) as batch_op:
+        batch_op.create_index('ix_user_stats_company_count', ['company_count', 'user_id'], unique=False)
+        batch_op.create_index('ix_user_stats_application_count', ['application_count', 'user_id'], unique=False)
+        batch_op.create_index('ix_user_stats_actions_30d', ['actions_30d', 'user_id'], unique=False)
+        batch_op.create_index('ix_user_stats_last_login_at', ['last_login_at', 'user_id'], unique=False)
+
+    with op.batch_alter_table('audit_log', schema=None) as batch_op:
+        batch_op.create_index('ix_audit_log_user_id_timestamp', ['user_id', 'timestamp'], unique=False)
+
+    # Prefix search on lower(username)/lower(email); text_pattern_ops lets
+    # Postgres use the index for LIKE 'abc%' under any collation.
+    ops = ' text_pattern_ops' if op.get_bind().dialect.name == 'postgresql' else ''
+    op.execute(f'CREATE INDEX ix_user_username_lower ON "user" (lower(username){ops})')
+    op.execute(f'CREATE INDEX ix_user_email_lower ON "user" (lower(email){ops})')
+
+    # Seed one row per existing user with real totals; the app only ever
+    # increments these rows, so they must exist before it starts writing.
+    window_start = ("now() - interval '30 days'" if op.get_bind().dialect.name == 'postgresql'
+                    else "datetime('now', '-30 days')")
+    op.execute(f'''
+        INSERT INTO user_stats (user_id, company_count, application_count, actions_30d, last_login_at, reconciled_at)
+        SELECT u.id,
+               (SELECT count(*) FROM company c WHERE c.user_id = u.id),
+               (SELECT count(*) FROM job_application a JOIN company c ON c.id = a.company_id
+                 WHERE c.user_id = u.id),
+               (SELECT count(*) FROM audit_log l WHERE l.user_id = u.id AND l.timestamp >= {window_start}),
+               (SELECT max(l.timestamp) FROM audit_log l WHERE l.user_id = u.id AND l.action = 'USER_LOGIN'),
+               CURRENT_TIMESTAMP
+        FROM "user" u
+    ''')
+
+
+def downgrade():
+    op.drop_index('ix_user_email_lower', table_name='user')
+    op.drop_index('ix_user_username_lower', table_name='user')
+
+    with op.batch_alter_table('audit_log', schema=None) as batch_op:
+        batch_op.drop_index('ix_audit_log_user_id_timestamp')
+
+    with op.batch_alter_table('user_stats', schema=None) as batch_op:
+        batch_op.drop_index('ix_user_stats_last_login_at')
+        batch_op.drop_index('ix_user_stats_application_count')
+        batch_op.drop_index('ix_user_stats_company_count')
+        batch_op.drop_index('ix_user_stats_actions_30d')
+
+    op.drop_table('user_stats')
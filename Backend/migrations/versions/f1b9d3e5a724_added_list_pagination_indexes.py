@@ -0,0 +1,48 @@
+"""Added composite indexes for keyset pagination of companies, applications and contacts
+
+Revision ID: f1b9d3e5a724
+Revises: e8f4c6a1b257
+Create Date: 2026-10-19 16:27:14.530981
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f1b9d3e5a724'
+down_revision = 'e8f4c6a1b257'
+branch_labels = None
+depends_on = None
+
+INDEXES = {
+    'company': [
+        ('ix_company_user_id_name_id', ['user_id', 'name', 'id']),
+        ('ix_company_user_id_created_at_id', ['user_id', 'created_at', 'id']),
+    ],
+    'job_application': [
+        ('ix_job_application_company_id_application_date_id', ['company_id', 'application_date', 'id']),
+        ('ix_job_application_company_id_status_date_id', ['company_id', 'status', 'application_date', 'id']),
+        ('ix_job_application_company_id_status_id', ['company_id', 'status', 'id']),
+        ('ix_job_application_company_id_job_title_id', ['company_id', 'job_title', 'id']),
+        ('ix_job_application_company_id_created_at_id', ['company_id', 'created_at', 'id']),
+    ],
+    'contact': [
+        ('ix_contact_company_id_name_id', ['company_id', 'name', 'id']),
+        ('ix_contact_company_id_created_at_id', ['company_id', 'created_at', 'id']),
+    ],
+}
+
+
+def upgrade():
+    for table, indexes in INDEXES.items():
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            for name, columns in indexes:
+                batch_op.create_index(name, columns, unique=False)
+
+
+def downgrade():
+    for table, indexes in INDEXES.items():
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            for name, _ in reversed(indexes):
+                batch_op.drop_index(name)
@@ -1,7 +1,12 @@
 from db import db
+from sqlalchemy import event
+from sqlalchemy.orm import Session
 from sqlalchemy.sql import func
 import datetime
 
+def _iso(value):
+    return value.isoformat() if value else None
+
 class User(db.Model):
     __tablename__ = "user"
     id = db.Column(db.Integer, primary_key=True)
@@ -14,10 +19,45 @@ class User(db.Model):
     reset_token_expiry = db.Column(db.DateTime, nullable=True)
     companies = db.relationship('Company', backref='user', lazy=True, cascade="all, delete-orphan")
     audit_logs = db.relationship('AuditLog', backref='user', lazy=True, cascade="all, delete-orphan")
+    notifications = db.relationship('Notification', backref='user', lazy=True, cascade="all, delete-orphan")
+    stats = db.relationship('UserStats', backref='user', uselist=False, lazy=True, cascade="all, delete-orphan")
+
+    # Prefix search for the admin directory (`lower(col) LIKE 'abc%'`)
+    __table_args__ = (
+        db.Index('ix_user_username_lower', func.lower(username).label('username_lower'),
+                 postgresql_ops={'username_lower': 'text_pattern_ops'}),
+        db.Index('ix_user_email_lower', func.lower(email).label('email_lower'),
+                 postgresql_ops={'email_lower': 'text_pattern_ops'}),
+    )
 
     def __repr__(self):
         return f'<User {self.username}>'
 
+class UserStats(db.Model):
+    """Precomputed per-user counters for the admin directory.
+
+    Kept current by the flush hook in stats.py and corrected periodically by
+    `flask reconcile-user-stats` (which also rolls the 30-day action window).
+    """
+    __tablename__ = "user_stats"
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id', ondelete='CASCADE'), primary_key=True)
+    company_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    application_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    actions_30d = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    last_login_at = db.Column(db.DateTime, nullable=True)
+    reconciled_at = db.Column(db.DateTime, nullable=True)
+
+    __table_args__ = (
+        # user_id is the directory's tie-breaker, so each sort is one ordered index scan
+        db.Index('ix_user_stats_company_count', 'company_count', 'user_id'),
+        db.Index('ix_user_stats_application_count', 'application_count', 'user_id'),
+        db.Index('ix_user_stats_actions_30d', 'actions_30d', 'user_id'),
+        db.Index('ix_user_stats_last_login_at', 'last_login_at', 'user_id'),
+    )
+
+    def __repr__(self):
+        return f'<UserStats {self.user_id}>'
+
 class AuditLog(db.Model):
     """ The 'God View' Log Table for Admin Monitoring"""
     __tablename__ = "audit_log"
@@ -27,6 +67,10 @@ class AuditLog(db.Model):
     details = db.Column(db.Text, nullable=True)
     timestamp = db.Column(db.DateTime, server_default=func.now())
 
+    __table_args__ = (
+        db.Index('ix_audit_log_user_id_timestamp', 'user_id', 'timestamp'),
+    )
+
     def to_dict(self):
         """Helper to convert log to JSON for the Admin Dashboard"""
         return {
@@ -44,9 +88,28 @@ class Company(db.Model):
     address = db.Column(db.String(250), nullable=True)
     website_url = db.Column(db.String(500), nullable=True)
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    created_at = db.Column(db.DateTime, server_default=func.now())
+    updated_at = db.Column(db.DateTime, server_default=func.now(), onupdate=func.now())
     applications = db.relationship('JobApplication', backref='company', lazy=True, cascade="all, delete-orphan")
     contacts = db.relationship('Contact', backref='company', lazy=True, cascade="all, delete-orphan")
 
+    __table_args__ = (
+        db.Index('ix_company_user_id_updated_at', 'user_id', 'updated_at'),
+        # Keyset pagination: (owner, sort column, id) serves both the seek and the ORDER BY
+        db.Index('ix_company_user_id_name_id', 'user_id', 'name', 'id'),
+        db.Index('ix_company_user_id_created_at_id', 'user_id', 'created_at', 'id'),
+    )
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "name": self.name,
+            "address": self.address,
+            "website_url": self.website_url,
+            "created_at": _iso(self.created_at),
+            "updated_at": _iso(self.updated_at)
+        }
+
     def __repr__(self):
         return f'<Company {self.name}>'
 
@@ -58,9 +121,54 @@ class JobApplication(db.Model):
     application_date = db.Column(db.DateTime, nullable=True)
     notes = db.Column(db.Text, nullable=True)
     job_url = db.Column(db.String(500), nullable=True)   
+    # sha256 of the owner id + normalized job_url (see duplicates.py)
+    job_url_hash = db.Column(db.String(64), nullable=True, index=True)
+    follow_up_at = db.Column(db.DateTime, nullable=True)
+    follow_up_done = db.Column(db.Boolean, nullable=False, default=False, server_default=db.false())
     company_id = db.Column(db.Integer, db.ForeignKey('company.id'), nullable=False)
+    created_at = db.Column(db.DateTime, server_default=func.now())
+    updated_at = db.Column(db.DateTime, server_default=func.now(), onupdate=func.now())
     resumes = db.relationship('Resume', backref='job_application', lazy=True, cascade="all, delete-orphan")
 
+    # Partial index: the reminder scheduler only ever looks at pending follow-ups,
+    # so finished/unset rows never enter the index no matter how large the table grows.
+    __table_args__ = (
+        db.Index(
+            'ix_job_application_follow_up_due',
+            'follow_up_at',
+            postgresql_where=db.text('follow_up_at IS NOT NULL AND follow_up_done = false'),
+            sqlite_where=db.text('follow_up_at IS NOT NULL AND follow_up_done = 0'),
+        ),
+        # Same predicate, per owner: backs the "my upcoming follow-ups" listing
+        db.Index(
+            'ix_job_application_company_follow_up_due',
+            'company_id', 'follow_up_at',
+            postgresql_where=db.text('follow_up_at IS NOT NULL AND follow_up_done = false'),
+            sqlite_where=db.text('follow_up_at IS NOT NULL AND follow_up_done = 0'),
+        ),
+        db.Index('ix_job_application_company_id_updated_at', 'company_id', 'updated_at'),
+        db.Index('ix_job_application_company_id_application_date_id', 'company_id', 'application_date', 'id'),
+        db.Index('ix_job_application_company_id_status_date_id', 'company_id', 'status', 'application_date', 'id'),
+        db.Index('ix_job_application_company_id_status_id', 'company_id', 'status', 'id'),
+        db.Index('ix_job_application_company_id_job_title_id', 'company_id', 'job_title', 'id'),
+        db.Index('ix_job_application_company_id_created_at_id', 'company_id', 'created_at', 'id'),
+    )
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "company_id": self.company_id,
+            "job_title": self.job_title,
+            "status": self.status,
+            "application_date": _iso(self.application_date),
+            "notes": self.notes,
+            "job_url": self.job_url,
+            "follow_up_at": _iso(self.follow_up_at),
+            "follow_up_done": self.follow_up_done,
+            "created_at": _iso(self.created_at),
+            "updated_at": _iso(self.updated_at)
+        }
+
     def __repr__(self):
         return f'<JobApplication {self.job_title}>'
 
@@ -71,6 +179,23 @@ class Resume(db.Model):
     data = db.Column(db.LargeBinary, nullable=False) 
     upload_date = db.Column(db.TIMESTAMP, server_default=func.now())
     application_id = db.Column(db.Integer, db.ForeignKey('job_application.id', ondelete='CASCADE'), nullable=False)
+    created_at = db.Column(db.DateTime, server_default=func.now())
+    updated_at = db.Column(db.DateTime, server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        db.Index('ix_resume_application_id_updated_at', 'application_id', 'updated_at'),
+    )
+
+    def to_dict(self):
+        """Metadata only; the file itself is fetched from the download endpoint"""
+        return {
+            "id": self.id,
+            "application_id": self.application_id,
+            "filename": self.filename,
+            "upload_date": _iso(self.upload_date),
+            "created_at": _iso(self.created_at),
+            "updated_at": _iso(self.updated_at)
+        }
 
     def __repr__(self):
         return f'<Resume {self.filename}>'
@@ -82,6 +207,87 @@ class Contact(db.Model):
     email = db.Column(db.String(150), nullable=True)
     phone = db.Column(db.String(50), nullable=True)
     company_id = db.Column(db.Integer, db.ForeignKey('company.id'), nullable=False)
+    created_at = db.Column(db.DateTime, server_default=func.now())
+    updated_at = db.Column(db.DateTime, server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        db.Index('ix_contact_company_id_updated_at', 'company_id', 'updated_at'),
+        db.Index('ix_contact_company_id_name_id', 'company_id', 'name', 'id'),
+        db.Index('ix_contact_company_id_created_at_id', 'company_id', 'created_at', 'id'),
+    )
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "company_id": self.company_id,
+            "name": self.name,
+            "email": self.email,
+            "phone": self.phone,
+            "created_at": _iso(self.created_at),
+            "updated_at": _iso(self.updated_at)
+        }
     
     def __repr__(self):
-        return f'<Contact {self.name}>'
\ No newline at end of file
+        return f'<Contact {self.name}>'
+
+class Notification(db.Model):
+    """In-app inbox entry created by the follow-up reminder scheduler"""
+    __tablename__ = "notification"
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id', ondelete='CASCADE'), nullable=False, index=True)
+    application_id = db.Column(db.Integer, db.ForeignKey('job_application.id', ondelete='CASCADE'), nullable=True)
+    message = db.Column(db.Text, nullable=False)
+    is_read = db.Column(db.Boolean, nullable=False, default=False, server_default=db.false())
+    created_at = db.Column(db.DateTime, server_default=func.now())
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "application_id": self.application_id,
+            "message": self.message,
+            "is_read": self.is_read,
+            "created_at": self.created_at.strftime('%Y-%m-%d %H:%M:%S') if self.created_at else None
+        }
+
+    def __repr__(self):
+        return f'<Notification {self.id}>'
+
+
+class DeletedRecord(db.Model):
+    """Tombstone written whenever a synced row is deleted, so /api/sync can report it"""
+    __tablename__ = "deleted_record"
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id', ondelete='CASCADE'), nullable=False)
+    entity_type = db.Column(db.String(30), nullable=False)
+    entity_id = db.Column(db.Integer, nullable=False)
+    deleted_at = db.Column(db.DateTime, server_default=func.now())
+
+    __table_args__ = (
+        db.Index('ix_deleted_record_user_id_deleted_at', 'user_id', 'deleted_at'),
+    )
+
+    def __repr__(self):
+        return f'<DeletedRecord {self.entity_type} {self.entity_id}>'
+
+# Models tracked by the sync endpoint, with how to reach the owning user from each row
+SYNCED_MODELS = {
+    Company: ('company', lambda obj: obj.user_id),
+    JobApplication: ('application', lambda obj: obj.company.user_id),
+    Contact: ('contact', lambda obj: obj.company.user_id),
+    Resume: ('resume', lambda obj: obj.job_application.company.user_id),
+}
+
+@event.listens_for(Session, 'before_flush')
+def record_deletions(session, flush_context, instances):
+    """Write a tombstone for every synced row deleted in this flush.
+
+    ORM cascades (company -> applications/contacts -> resumes) put the children
+    in `session.deleted` too, so each of them gets its own tombstone.
+    """
+    with session.no_autoflush:
+        for obj in list(session.deleted):
+            tracked = SYNCED_MODELS.get(type(obj))
+            if not tracked:
+                continue
+            entity_type, owner_of = tracked
+            session.add(DeletedRecord(user_id=owner_of(obj), entity_type=entity_type, entity_id=obj.id))
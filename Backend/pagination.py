@@ -0,0 +1,90 @@
+# pagination.py
+import json
+import base64
+import datetime
+from sqlalchemy import tuple_
+
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 200
+
+
+def parse_limit(value):
+    if value is None or value == '':
+        return DEFAULT_LIMIT
+    try:
+        limit = int(value)
+    except (TypeError, ValueError):
+        limit = 0
+    if limit < 1:
+        raise ValueError("limit must be a positive integer")
+    return min(limit, MAX_LIMIT)
+
+
+def encode_cursor(sort_key, descending, value, row_id):
+    if isinstance(value, datetime.datetime):
+        value = {"dt": value.isoformat()}
+    payload = json.dumps([sort_key, descending, value, row_id], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor, sort_key, descending):
+    """Returns (last sort value, last id); the cursor must come from the same sort/order"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        key, desc, value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if isinstance(value, dict):
+            value = datetime.datetime.fromisoformat(value["dt"])
+    except (ValueError, TypeError, KeyError):
+        raise ValueError("Invalid cursor")
+    if key != sort_key or desc != descending:
+        raise ValueError("Cursor does not match the requested sort order")
+    return value, row_id
+
+
+def keyset_page(query, sort_key, sort_column, id_column, descending=False, cursor=None, limit=DEFAULT_LIMIT,
+                key_of=None):
+    """One page of `query` ordered by (sort_column, id_column), NULL sort values last.
+
+    Seeks past the previous page's last row with a row-value comparison,
+    `(sort_column, id) > (:value, :id)`, instead of OFFSET, so each page is a
+    single range scan of a (..., sort_column, id) index and rows don't shift
+    between pages when others are inserted. A nullable sort column is read in
+    two steps, non-NULL values first and then the NULL block by id, so neither
+    step needs NULLS LAST ordering the index can't provide.
+    Returns (rows, next_cursor or None).
+
+    `key_of(row)` returns a row's (sort value, id); the default reads both
+    columns off the row, which suits single-entity queries.
+    """
+    nullable = getattr(getattr(sort_column, 'expression', sort_column), 'nullable', True)
+    last_value = last_id = None
+    if cursor:
+        last_value, last_id = decode_cursor(cursor, sort_key, descending)
+    in_null_block = bool(cursor) and last_value is None
+
+    def directed(column):
+        return column.desc() if descending else column.asc()
+
+    rows = []
+    if not in_null_block:
+        values = query.filter(sort_column.isnot(None)) if nullable else query
+        if cursor:
+            after = (tuple_(sort_column, id_column) < tuple_(last_value, last_id) if descending
+                     else tuple_(sort_column, id_column) > tuple_(last_value, last_id))
+            values = values.filter(after)
+        rows = values.order_by(directed(sort_column), directed(id_column)).limit(limit + 1).all()
+    if nullable and len(rows) <= limit:
+        nulls = query.filter(sort_column.is_(None))
+        if in_null_block:
+            nulls = nulls.filter(id_column < last_id if descending else id_column > last_id)
+        rows += nulls.order_by(directed(id_column)).limit(limit + 1 - len(rows)).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        if key_of is None:
+            last_value, last_id = getattr(rows[-1], sort_column.key), getattr(rows[-1], id_column.key)
+        else:
+            last_value, last_id = key_of(rows[-1])
+        next_cursor = encode_cursor(sort_key, descending, last_value, last_id)
+    return rows, next_cursor
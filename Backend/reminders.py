@@ -0,0 +1,130 @@
+# reminders.py
+import os
+import time
+import logging
+import datetime
+from sqlalchemy.orm import joinedload
+from db import db
+from models import Company, JobApplication, Notification
+
+logger = logging.getLogger('reminders')
+
+DEFAULT_BATCH_SIZE = 500
+
+# ==========================================
+#  NOTIFICATION SINKS
+# ==========================================
+# A sink receives every due application and decides how the user is told about it.
+# Sinks only need a `notify(application)` method; they must not commit, the
+# scheduler commits once per batch together with the `follow_up_done` flag.
+
+def _reminder_message(application):
+    return f"Follow up on {application.job_title} at {application.company.name}"
+
+class LogSink:
+    """Writes reminders to the application log (default, handy for local dev)"""
+    def notify(self, application):
+        logger.info("[user %s] %s", application.company.user_id, _reminder_message(application))
+
+class FileSink:
+    """Appends one line per reminder to a local text file"""
+    def __init__(self, path):
+        self.path = path
+
+    def notify(self, application):
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(f"{datetime.datetime.utcnow().isoformat()}\t{application.company.user_id}\t{application.id}\t{_reminder_message(application)}\n")
+
+class InboxSink:
+    """Stores reminders in the `notification` table so the UI can show them"""
+    def notify(self, application):
+        db.session.add(Notification(
+            user_id=application.company.user_id,
+            application_id=application.id,
+            message=_reminder_message(application)
+        ))
+
+def get_sink(name, path=None):
+    if name == 'log':
+        return LogSink()
+    if name == 'file':
+        return FileSink(path or os.getenv('REMINDER_FILE', 'reminders.log'))
+    if name == 'inbox':
+        return InboxSink()
+    raise ValueError(f"Unknown reminder sink: {name}")
+
+# ==========================================
+#  SCHEDULER
+# ==========================================
+
+def due_follow_ups_query(now):
+    """Pending follow-ups whose time has come.
+
+    The filter mirrors the WHERE clause of `ix_job_application_follow_up_due`
+    (`follow_up_done = false`, not `IS false`, which older Postgres planners
+    can't match against the index predicate).
+    """
+    return JobApplication.query.filter(
+        JobApplication.follow_up_at.isnot(None),
+        JobApplication.follow_up_done == db.false(),
+        JobApplication.follow_up_at <= now
+    )
+
+def process_due_follow_ups(sink, batch_size=DEFAULT_BATCH_SIZE, now=None):
+    """Notify and mark every due follow-up, one bounded batch per transaction.
+
+    Rows are locked with SKIP LOCKED (Postgres) so several scheduler processes
+    can run side by side without sending the same reminder twice.
+    Returns the number of reminders sent.
+    """
+    now = now or datetime.datetime.utcnow()
+    total = 0
+    while True:
+        batch = (due_follow_ups_query(now)
+                 .options(joinedload(JobApplication.company))
+                 .order_by(JobApplication.follow_up_at, JobApplication.id)
+                 .limit(batch_size)
+                 .with_for_update(skip_locked=True, of=JobApplication)
+                 .all())
+        if not batch:
+            # End the (empty) locking transaction so the worker doesn't sit
+            # idle in transaction until its next run
+            db.session.rollback()
+            break
+        try:
+            for application in batch:
+                sink.notify(application)
+                application.follow_up_done = True
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        total += len(batch)
+        if len(batch) < batch_size:
+            break
+    return total
+
+def run_scheduler(sink, batch_size=DEFAULT_BATCH_SIZE, interval=None):
+    """Process due follow-ups once, or forever every `interval` seconds"""
+    while True:
+        sent = process_due_follow_ups(sink, batch_size=batch_size)
+        if sent:
+            logger.info("Sent %s follow-up reminder(s)", sent)
+        if not interval:
+            return sent
+        time.sleep(interval)
+
+def upcoming_follow_ups_query(user_id):
+    """A user's pending follow-ups, soonest first.
+
+    Served per company by `ix_job_application_company_follow_up_due`, so the
+    work is bounded by this user's pending rows, not everyone's.
+    """
+    return (JobApplication.query.join(Company)
+            .options(joinedload(JobApplication.company))
+            .filter(
+                Company.user_id == user_id,
+                JobApplication.follow_up_at.isnot(None),
+                JobApplication.follow_up_done == db.false()
+            )
+            .order_by(JobApplication.follow_up_at, JobApplication.id))
@@ -0,0 +1,186 @@
+# routing.py
+import os
+import time
+import random
+import logging
+import threading
+from functools import wraps
+from contextlib import contextmanager
+import sqlalchemy as sa
+from flask import g, has_app_context
+from flask_sqlalchemy.session import Session
+from flask_jwt_extended import get_jwt_identity
+
+logger = logging.getLogger('routing')
+
+# Replicas further behind the primary than this are skipped
+REPLICA_MAX_LAG = float(os.getenv('REPLICA_MAX_LAG_SECONDS', 5))
+# How long a replica's measured lag (or failure) is trusted before re-checking
+LAG_CHECK_INTERVAL = float(os.getenv('REPLICA_LAG_CHECK_SECONDS', 5))
+# After a user writes, their reads stay on the primary for this long. It must
+# cover the worst lag we still accept plus the time a lag reading is cached.
+READ_YOUR_WRITES = float(os.getenv('READ_YOUR_WRITES_SECONDS', REPLICA_MAX_LAG + LAG_CHECK_INTERVAL))
+# Lag probes run inside request threads; an unreachable replica must fail fast
+REPLICA_CONNECT_TIMEOUT = int(os.getenv('REPLICA_CONNECT_TIMEOUT_SECONDS', 2))
+
+# Standby replay delay in seconds; 0 on a server that is not a standby (e.g. a
+# second local Postgres used as a stand-in). "Everything received is replayed"
+# only means fresh while the WAL receiver is streaming: a disconnected or
+# stalled receiver also has nothing left to replay, so that case returns NULL
+# and the replica is skipped. Without pg_read_all_stats the app role sees the
+# receiver's row but not its status, so only its presence is checked then.
+_PG_LAG_SQL = sa.text(
+    "SELECT CASE WHEN NOT pg_is_in_recovery() THEN 0 "
+    "WHEN NOT EXISTS (SELECT 1 FROM pg_stat_wal_receiver "
+    "WHERE coalesce(status, 'streaming') = 'streaming') THEN NULL "
+    "WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) END"
+)
+
+
+def replica_bind_keys(urls):
+    """SQLALCHEMY_BINDS entries for a comma separated DATABASE_REPLICA_URLS value"""
+    urls = [u.strip() for u in (urls or '').split(',') if u.strip()]
+    binds = {}
+    for i, url in enumerate(urls):
+        if url.startswith('postgresql'):
+            binds[f'replica_{i}'] = {"url": url, "connect_args": {"connect_timeout": REPLICA_CONNECT_TIMEOUT}}
+        else:
+            binds[f'replica_{i}'] = url
+    return binds
+
+
+class ReplicaRouter:
+    """Picks a replica engine for read-only requests and tracks recent writers.
+
+    Both the lag cache and the recent-writer table live in process memory,
+    which matches the single gunicorn process the Procfile runs.
+    """
+    def __init__(self):
+        self.bind_keys = []
+        self._lock = threading.Lock()
+        self._health = {}       # bind key -> (checked_at, usable)
+        self._last_write = {}   # user id -> monotonic time of last commit
+
+    def init_app(self, app):
+        self.bind_keys = [k for k in app.config.get('SQLALCHEMY_BINDS', {}) if k.startswith('replica_')]
+        app.extensions['replica_router'] = self
+
+    # --- read-your-writes ---
+    def record_write(self, user_id):
+        now = time.monotonic()
+        with self._lock:
+            self._last_write[str(user_id)] = now
+            if len(self._last_write) > 10000:
+                cutoff = now - READ_YOUR_WRITES
+                self._last_write = {u: t for u, t in self._last_write.items() if t > cutoff}
+
+    def wrote_recently(self, user_id):
+        if user_id is None:
+            return False
+        with self._lock:
+            last = self._last_write.get(str(user_id))
+        return last is not None and time.monotonic() - last < READ_YOUR_WRITES
+
+    # --- lag-aware replica choice ---
+    def _usable(self, key, engine):
+        now = time.monotonic()
+        with self._lock:
+            checked = self._health.get(key)
+        if checked and now - checked[0] < LAG_CHECK_INTERVAL:
+            return checked[1]
+        try:
+            with engine.connect() as conn:
+                lag = conn.execute(_PG_LAG_SQL).scalar() if engine.dialect.name == 'postgresql' else 0
+            if lag is None:
+                usable = False
+                logger.warning("Replica %s is not streaming from the primary, reading from primary", key)
+            else:
+                usable = lag <= REPLICA_MAX_LAG
+                if not usable:
+                    logger.warning("Replica %s is %.1fs behind, reading from primary", key, lag)
+        except Exception as e:
+            logger.warning("Replica %s unavailable, reading from primary: %s", key, e)
+            usable = False
+        with self._lock:
+            self._health[key] = (now, usable)
+        return usable
+
+    def choose(self, engines):
+        """A healthy replica engine, or None to use the primary"""
+        keys = list(self.bind_keys)
+        random.shuffle(keys)
+        for key in keys:
+            if self._usable(key, engines[key]):
+                return engines[key]
+        return None
+
+
+router = ReplicaRouter()
+
+
+class RoutingSession(Session):
+    """Sends SELECTs from read-only requests to a replica, everything else to the primary"""
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and self._use_replica(clause):
+            engine = g.get('replica_engine')
+            if engine is None:
+                engine = router.choose(self._db.engines) or False
+                g.replica_engine = engine
+            if engine:
+                return engine
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+    def _use_replica(self, clause):
+        if self._flushing or isinstance(clause, sa.UpdateBase):
+            return False
+        if not has_app_context() or not g.get('read_replica') or g.get('db_wrote'):
+            return False
+        return bool(router.bind_keys)
+
+
+@sa.event.listens_for(RoutingSession, 'after_flush')
+def _mark_write(session, flush_context):
+    # Anything read later in the same request must see this write
+    if has_app_context():
+        g.db_wrote = True
+
+
+def read_replica(fn):
+    """Route a read-only endpoint to a replica.
+
+    Place below @jwt_required/@admin_required so the caller is known; users
+    who wrote within READ_YOUR_WRITES seconds keep reading from the primary.
+    """
+    @wraps(fn)
+    def decorator(*args, **kwargs):
+        try:
+            user_id = get_jwt_identity()
+        except RuntimeError:
+            user_id = None
+        g.read_replica = not router.wrote_recently(user_id)
+        return fn(*args, **kwargs)
+    return decorator
+
+
+@contextmanager
+def use_primary():
+    """Force the primary for reads inside the block, e.g. to retry a replica miss"""
+    previous = g.get('read_replica')
+    g.read_replica = False
+    try:
+        yield
+    finally:
+        g.read_replica = previous
+
+
+def record_request_write(response):
+    """after_request hook: remember users who committed changes in this request"""
+    if g.get('db_wrote'):
+        try:
+            user_id = get_jwt_identity()
+        except RuntimeError:
+            user_id = None
+        if user_id is not None:
+            router.record_write(user_id)
+    return response
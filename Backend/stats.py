@@ -0,0 +1,123 @@
+# stats.py
+import time
+import logging
+import datetime
+from collections import defaultdict
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+from db import db
+from models import User, Company, JobApplication, AuditLog, UserStats
+
+logger = logging.getLogger('stats')
+
+ACTIVITY_WINDOW = datetime.timedelta(days=30)
+RECONCILE_BATCH_SIZE = 1000
+
+# ==========================================
+#  INCREMENTAL MAINTENANCE
+# ==========================================
+
+@event.listens_for(Session, 'before_flush')
+def maintain_user_stats(session, flush_context, instances):
+    """Fold this flush's inserts/deletes into `user_stats` in the same transaction.
+
+    Hooking the flush instead of each endpoint means ORM cascades (deleting a
+    company removes its applications) are counted too. Every user gets a
+    stats row on register (and the migration seeded existing users), so the
+    deltas are always applied to a row holding real totals.
+    """
+    deltas = defaultdict(lambda: {"company_count": 0, "application_count": 0, "actions_30d": 0, "login": False})
+    with session.no_autoflush:
+        for obj, sign in [(o, 1) for o in session.new] + [(o, -1) for o in session.deleted]:
+            if isinstance(obj, Company):
+                deltas[obj.user_id]["company_count"] += sign
+            elif isinstance(obj, JobApplication):
+                company = obj.company or session.get(Company, obj.company_id)
+                if company is not None:
+                    deltas[company.user_id]["application_count"] += sign
+            elif isinstance(obj, AuditLog) and sign == 1:
+                deltas[obj.user_id]["actions_30d"] += 1
+                if obj.action == "USER_LOGIN":
+                    deltas[obj.user_id]["login"] = True
+    if not deltas:
+        return
+    for user_id, delta in deltas.items():
+        if user_id is None:
+            continue
+        _apply_delta(session, int(user_id), delta)
+
+def _apply_delta(session, user_id, delta):
+    table = UserStats.__table__
+    changes = {k: table.c[k] + delta[k] for k in ("company_count", "application_count", "actions_30d") if delta[k]}
+    if delta["login"]:
+        changes["last_login_at"] = func.now()
+    if changes:
+        session.execute(table.update().where(table.c.user_id == user_id).values(**changes))
+
+# ==========================================
+#  RECONCILIATION
+# ==========================================
+
+def reconcile_user_stats(batch_size=RECONCILE_BATCH_SIZE):
+    """Recompute every user's counters from the source tables, one batch of users at a time.
+
+    Fixes any drift from writes that bypassed the ORM and ages actions out of
+    the 30-day window. Each batch is a handful of grouped, indexed queries
+    over that batch's users only. Returns the number of users processed.
+    """
+    now = db.session.scalar(db.select(func.now()))
+    window_start = now - ACTIVITY_WINDOW
+    last_id, total = 0, 0
+    while True:
+        user_ids = [row[0] for row in db.session.query(User.id).filter(User.id > last_id)
+                    .order_by(User.id).limit(batch_size)]
+        if not user_ids:
+            # End the transaction the last (empty) read opened; otherwise the
+            # next pass's now() is this one's start and the session idles in it
+            db.session.rollback()
+            break
+        companies = dict(db.session.query(Company.user_id, func.count(Company.id))
+                         .filter(Company.user_id.in_(user_ids)).group_by(Company.user_id))
+        applications = dict(db.session.query(Company.user_id, func.count(JobApplication.id))
+                            .join(JobApplication, JobApplication.company_id == Company.id)
+                            .filter(Company.user_id.in_(user_ids)).group_by(Company.user_id))
+        actions = dict(db.session.query(AuditLog.user_id, func.count(AuditLog.id))
+                       .filter(AuditLog.user_id.in_(user_ids), AuditLog.timestamp >= window_start)
+                       .group_by(AuditLog.user_id))
+        logins = dict(db.session.query(AuditLog.user_id, func.max(AuditLog.timestamp))
+                      .filter(AuditLog.user_id.in_(user_ids), AuditLog.action == "USER_LOGIN")
+                      .group_by(AuditLog.user_id))
+        existing = {s.user_id: s for s in UserStats.query.filter(UserStats.user_id.in_(user_ids))}
+        for user_id in user_ids:
+            row = existing.get(user_id)
+            if row is None:
+                row = UserStats(user_id=user_id)
+                db.session.add(row)
+            row.company_count = companies.get(user_id, 0)
+            row.application_count = applications.get(user_id, 0)
+            row.actions_30d = actions.get(user_id, 0)
+            row.last_login_at = logins.get(user_id)
+            row.reconciled_at = now
+        # Counters were just set from the source tables; the flush hook sees no
+        # new companies/applications/logs here so it leaves them untouched.
+        db.session.commit()
+        total += len(user_ids)
+        last_id = user_ids[-1]
+    return total
+
+def run_reconciler(batch_size=RECONCILE_BATCH_SIZE, interval=None):
+    """Reconcile once, or forever every `interval` seconds"""
+    while True:
+        try:
+            count = reconcile_user_stats(batch_size=batch_size)
+            logger.info("Reconciled stats for %s user(s)", count)
+        except Exception:
+            db.session.rollback()
+            if not interval:
+                raise
+            count = 0
+            logger.exception("Reconciliation failed, retrying in %ss", interval)
+        if not interval:
+            return count
+        time.sleep(interval)
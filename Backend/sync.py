@@ -0,0 +1,110 @@
+# sync.py
+import time
+import logging
+import datetime
+from sqlalchemy import text
+from sqlalchemy.sql import func
+from db import db
+from models import Company, JobApplication, Contact, Resume, DeletedRecord
+
+logger = logging.getLogger('sync')
+
+# `updated_at`/`deleted_at` come from now(), which in Postgres is the *start* of
+# the writing transaction. A transaction still open when a cursor is handed out
+# will later commit rows stamped with its start time, so the cursor is held back
+# to the oldest open transaction of the app's role rather than being "now".
+#
+# Constraint: every open transaction of that role pins every user's cursor, so
+# each /api/sync keeps re-sending everything changed since it began. Background
+# jobs (send-reminders, reconcile-user-stats, purge-tombstones) must not idle in
+# a transaction between runs, and ad-hoc psql sessions or migrations should
+# connect as a different role. Sessions of other roles are not considered,
+# which also means they must not write the synced tables.
+_PG_CURSOR_SQL = text(
+    "SELECT LEAST(now(), (SELECT min(xact_start) FROM pg_stat_activity "
+    "WHERE datname = current_database() AND usename = current_user AND xact_start IS NOT NULL))"
+)
+
+# Tombstones older than this are purged; cursors older than this get a full snapshot.
+TOMBSTONE_RETENTION = datetime.timedelta(days=30)
+
+def parse_cursor(value):
+    """Cursors are the ISO timestamps previously handed out by `build_changes`"""
+    if not value:
+        return None
+    return _naive(datetime.datetime.fromisoformat(value))
+
+def _since(query, column, since):
+    # >= because rows stamped exactly at the cursor may have committed after it;
+    # clients upsert by id, so re-sending them is harmless.
+    return query if since is None else query.filter(column >= since)
+
+def _take_cursor():
+    """A point in time after which every not-yet-seen change is guaranteed to be stamped"""
+    if db.session.get_bind().dialect.name == 'postgresql':
+        return _naive(db.session.scalar(_PG_CURSOR_SQL))
+    # SQLite serializes writers, so its clock needs no holding back (and now()
+    # stamps in the same text format the cursor is bound in, see db.py)
+    return _naive(db.session.scalar(db.select(func.now())))
+
+def build_changes(user_id, since=None):
+    """Everything created, changed or deleted for `user_id` after `since`.
+
+    With no cursor (or one older than the tombstone retention window) the
+    full data set is returned and `full` is set so the client can replace its
+    local copy instead of merging.
+    """
+    # Columns are timezone-naive and filled by the database clock, so the cursor
+    # is taken from the same clock and stored the same way.
+    cursor = _take_cursor()
+    full = since is None or since < cursor - TOMBSTONE_RETENTION
+    if full:
+        since = None
+
+    companies = _since(Company.query.filter(Company.user_id == user_id), Company.updated_at, since)
+    applications = _since(
+        JobApplication.query.join(Company).filter(Company.user_id == user_id), JobApplication.updated_at, since
+    )
+    contacts = _since(Contact.query.join(Company).filter(Company.user_id == user_id), Contact.updated_at, since)
+    resumes = _since(
+        Resume.query.join(JobApplication).join(Company).filter(Company.user_id == user_id), Resume.updated_at, since
+    ).options(db.defer(Resume.data))
+
+    deleted = {"company": [], "application": [], "contact": [], "resume": []}
+    if not full:
+        tombstones = _since(
+            DeletedRecord.query.filter(DeletedRecord.user_id == user_id), DeletedRecord.deleted_at, since
+        )
+        for record in tombstones:
+            deleted[record.entity_type].append(record.entity_id)
+
+    return {
+        "cursor": cursor.isoformat(),
+        "full": full,
+        "companies": [c.to_dict() for c in companies],
+        "applications": [a.to_dict() for a in applications],
+        "contacts": [c.to_dict() for c in contacts],
+        "resumes": [r.to_dict() for r in resumes],
+        "deleted": deleted
+    }
+
+def purge_tombstones():
+    """Drop tombstones that no valid cursor can still ask about"""
+    now = _naive(db.session.scalar(db.select(func.now())))
+    removed = DeletedRecord.query.filter(DeletedRecord.deleted_at < now - TOMBSTONE_RETENTION).delete(
+        synchronize_session=False
+    )
+    db.session.commit()
+    return removed
+
+def run_purger(interval=None):
+    """Purge once, or forever every `interval` seconds"""
+    while True:
+        removed = purge_tombstones()
+        logger.info("Purged %s tombstone(s)", removed)
+        if not interval:
+            return removed
+        time.sleep(interval)
+
+def _naive(value):
+    return value.replace(tzinfo=None) if value.tzinfo else value
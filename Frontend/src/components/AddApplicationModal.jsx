@@ -39,7 +39,9 @@ function AddApplicationModal({ isOpen, onClose, companyId, onApplicationAdded })
       })
 
       if (response.ok) {
+        const data = await response.json()
         toast.success("New Application Added")
+        if (data.duplicate_of?.length) toast("Heads up: you already saved this job posting", { icon: '⚠️' })
         setJobTitle(''); setStatus('To Apply'); setJobUrl(''); setNotes(''); setDate('')
         onApplicationAdded() 
         onClose()
@@ -1,4 +1,4 @@
-import { useState, useEffect } from 'react';
+import { useState, useEffect, useRef } from 'react';
 import { useAuth } from '../context/AuthContext';
 import { toast } from 'react-hot-toast';
 
@@ -6,17 +6,45 @@ const AdminDashboard = () => {
   const { token } = useAuth();
   const [users, setUsers] = useState([]);
   const [logs, setLogs] = useState([]);
-  const [stats, setStats] = useState({ totalUsers: 0, systemActivity: 0 });
+  const [stats, setStats] = useState({ totalUsers: 0, totalIsCapped: false, systemActivity: 0 });
   const [loading, setLoading] = useState(true);
+  const [page, setPage] = useState(1);
+  // cursors[i] fetches page i + 1; the directory is keyset-paged, so pages
+  // can only be reached by walking forward from the first one
+  const [cursors, setCursors] = useState([null]);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [search, setSearch] = useState('');
+  const [sort, setSort] = useState('username');
+  const PER_PAGE = 25;
 
   // --- Data Fetching Logic ---
+  const usersUrl = () => {
+    const params = new URLSearchParams({ limit: PER_PAGE, sort, order: sort === 'username' ? 'asc' : 'desc' });
+    if (search.trim()) params.set('q', search.trim());
+    if (cursors[page - 1]) params.set('cursor', cursors[page - 1]);
+    return `https://job-application-tracker-3n97.onrender.com/api/admin/users?${params}`;
+  };
+
+  const fetchUsers = async () => {
+    try {
+      const res = await fetch(usersUrl(), { headers: { 'Authorization': `Bearer ${token}` } });
+      if (!res.ok) throw new Error("Server error");
+      const usersData = await res.json();
+      setUsers(usersData.users);
+      setNextCursor(usersData.next_cursor);
+      setStats(s => ({ ...s, totalUsers: usersData.total, totalIsCapped: usersData.total_is_capped }));
+    } catch (err) {
+      console.error("Fetch error:", err);
+    }
+  };
+
   const fetchAdminData = async () => {
     try {
       const headers = { 'Authorization': `Bearer ${token}` };
       
       // Parallel fetching for performance
       const [usersRes, logsRes] = await Promise.all([
-        fetch('https://job-application-tracker-3n97.onrender.com/api/admin/users', { headers }),
+        fetch(usersUrl(), { headers }),
         fetch('https://job-application-tracker-3n97.onrender.com/api/admin/logs', { headers })
       ]);
 
@@ -25,10 +53,12 @@ const AdminDashboard = () => {
       const usersData = await usersRes.json();
       const logsData = await logsRes.json();
 
-      setUsers(usersData);
+      setUsers(usersData.users);
+      setNextCursor(usersData.next_cursor);
       setLogs(logsData);
       setStats({ 
-        totalUsers: usersData.length, 
+        totalUsers: usersData.total, 
+        totalIsCapped: usersData.total_is_capped,
         systemActivity: logsData.length 
       });
     } catch (err) {
@@ -40,14 +70,82 @@ const AdminDashboard = () => {
     }
   };
 
+  // The stream is opened once; its listeners go through this ref so a resync
+  // reloads the page, sort and search the admin is looking at right now
+  const fetchAdminDataRef = useRef(fetchAdminData);
+  fetchAdminDataRef.current = fetchAdminData;
+
   useEffect(() => {
     fetchAdminData();
     
-    // 🔄 AUTO-POLLING: Refresh data every 60 seconds for "Live" feel
-    const interval = setInterval(fetchAdminData, 60000); 
-    return () => clearInterval(interval);
+    // 📡 LIVE STREAM: the server pushes new audit logs and user status changes.
+    // The stream URL carries a one-minute token, never the login token. The
+    // browser retries on its own while that token is valid; once a retry is
+    // refused we fetch a fresh one and resume from the last event we saw.
+    const API = 'https://job-application-tracker-3n97.onrender.com/api/admin';
+    let source = null;
+    let lastEventId = null;
+    let retryTimer = null;
+    let stopped = false;
+
+    const connect = async () => {
+      try {
+        const res = await fetch(`${API}/stream-token`, {
+          method: 'POST',
+          headers: { 'Authorization': `Bearer ${token}` }
+        });
+        if (!res.ok) throw new Error(`stream token: ${res.status}`);
+        const { token: streamToken } = await res.json();
+        if (stopped) return;
+        const resume = lastEventId !== null ? `&lastEventId=${lastEventId}` : '';
+        source = new EventSource(`${API}/stream?jwt=${encodeURIComponent(streamToken)}${resume}`);
+      } catch (err) {
+        console.error("Admin stream unavailable", err);
+        if (!stopped) retryTimer = setTimeout(connect, 5000);
+        return;
+      }
+
+      source.addEventListener('log', (e) => {
+        if (e.lastEventId) lastEventId = e.lastEventId;
+        const log = JSON.parse(e.data);
+        setLogs(prev => prev.some(l => l.id === log.id) ? prev : [log, ...prev]);
+      });
+
+      source.addEventListener('user_status', (e) => {
+        if (e.lastEventId) lastEventId = e.lastEventId;
+        const changed = JSON.parse(e.data);
+        setUsers(prev => prev.map(u => u.id === changed.id ? { ...u, ...changed } : u));
+      });
+
+      // Sent after a reconnect when missed changes can't be replayed one by one
+      source.addEventListener('resync', () => fetchAdminDataRef.current());
+
+      source.onerror = () => {
+        if (source.readyState === EventSource.CLOSED && !stopped) {
+          retryTimer = setTimeout(connect, 5000);
+        }
+      };
+    };
+
+    connect();
+
+    return () => {
+      stopped = true;
+      clearTimeout(retryTimer);
+      if (source) source.close();
+    };
   }, [token]);
 
+  // Keep the activity counter in step with streamed logs
+  useEffect(() => {
+    setStats(s => ({ ...s, systemActivity: logs.length }));
+  }, [logs]);
+
+  // Only the user page is reloaded when paging, searching or sorting
+  useEffect(() => {
+    if (!loading) fetchUsers();
+  }, [page, cursors, search, sort]);
+
   // --- Action Handlers ---
   const handleExportLogs = async () => {
     try {
@@ -86,7 +184,7 @@ const AdminDashboard = () => {
 
       if (res.ok) {
         toast.success(`User ${newStatus === 'active' ? 'enabled' : 'disabled'}`);
-        fetchAdminData(); 
+        setUsers(prev => prev.map(u => u.id === userId ? { ...u, status: newStatus } : u));
       } else {
         throw new Error();
       }
@@ -110,7 +208,7 @@ const AdminDashboard = () => {
         
         {/* --- Stats Overview --- */}
         <div className="grid grid-cols-1 md:grid-cols-3 gap-6">
-          <StatCard title="Total Users" value={stats.totalUsers} color="from-blue-500 to-indigo-600" />
+          <StatCard title="Total Users" value={stats.totalIsCapped ? `${stats.totalUsers}+` : stats.totalUsers} color="from-blue-500 to-indigo-600" />
           <StatCard title="System Activity" value={stats.systemActivity} color="from-purple-500 to-pink-600" />
           <StatCard title="Platform Status" value="Healthy" color="from-emerald-500 to-teal-600" />
         </div>
@@ -118,9 +216,31 @@ const AdminDashboard = () => {
         <div className="grid grid-cols-1 lg:grid-cols-3 gap-8">
           {/* --- User Management Table --- */}
           <div className="lg:col-span-2 bg-white/5 backdrop-blur-md rounded-2xl border border-white/10 p-6 shadow-2xl">
-            <h2 className="text-xl font-bold mb-6 flex items-center gap-2">
-              👤 User Management
-            </h2>
+            <div className="flex flex-wrap justify-between items-center gap-3 mb-6">
+              <h2 className="text-xl font-bold flex items-center gap-2">
+                👤 User Management
+              </h2>
+              <div className="flex gap-2">
+                <input
+                  type="text"
+                  value={search}
+                  onChange={(e) => { setSearch(e.target.value); setPage(1); setCursors([null]); }}
+                  placeholder="Search username or email"
+                  className="px-3 py-1.5 bg-slate-800/50 border border-white/10 rounded-lg text-sm text-slate-100 placeholder-slate-500 focus:outline-none focus:border-indigo-500"
+                />
+                <select
+                  value={sort}
+                  onChange={(e) => { setSort(e.target.value); setPage(1); setCursors([null]); }}
+                  className="px-3 py-1.5 bg-slate-800/50 border border-white/10 rounded-lg text-sm text-slate-100 focus:outline-none focus:border-indigo-500"
+                >
+                  <option value="username">Username</option>
+                  <option value="activity">Most active (30d)</option>
+                  <option value="last_login">Last login</option>
+                  <option value="applications">Applications</option>
+                  <option value="companies">Companies</option>
+                </select>
+              </div>
+            </div>
             <div className="overflow-x-auto">
               <table className="w-full text-left">
                 <thead>
@@ -128,6 +248,10 @@ const AdminDashboard = () => {
                     <th className="pb-4">Username</th>
                     <th className="pb-4">Status</th>
                     <th className="pb-4">Role</th>
+                    <th className="pb-4">Companies</th>
+                    <th className="pb-4">Apps</th>
+                    <th className="pb-4">Actions (30d)</th>
+                    <th className="pb-4">Last Login</th>
                     <th className="pb-4">Actions</th>
                   </tr>
                 </thead>
@@ -141,6 +265,10 @@ const AdminDashboard = () => {
                         </span>
                       </td>
                       <td className="py-4 text-slate-400">{u.is_admin ? '🛡️ Admin' : 'User'}</td>
+                      <td className="py-4 text-slate-400">{u.company_count}</td>
+                      <td className="py-4 text-slate-400">{u.application_count}</td>
+                      <td className="py-4 text-slate-400">{u.actions_30d}</td>
+                      <td className="py-4 text-slate-400">{u.last_login_at || '—'}</td>
                       <td className="py-4">
                         {!u.is_admin && (
                           <button 
@@ -156,6 +284,31 @@ const AdminDashboard = () => {
                 </tbody>
               </table>
             </div>
+            <div className="flex justify-between items-center mt-4 text-sm text-slate-400">
+              <span>
+                Page {page}
+                {!stats.totalIsCapped && ` of ${Math.max(1, Math.ceil(stats.totalUsers / PER_PAGE))}`}
+              </span>
+              <div className="flex gap-2">
+                <button
+                  onClick={() => setPage(p => p - 1)}
+                  disabled={page <= 1}
+                  className="px-3 py-1 rounded-lg border border-white/10 hover:bg-white/5 disabled:opacity-40"
+                >
+                  Prev
+                </button>
+                <button
+                  onClick={() => {
+                    setCursors(prev => [...prev.slice(0, page), nextCursor]);
+                    setPage(p => p + 1);
+                  }}
+                  disabled={!nextCursor}
+                  className="px-3 py-1 rounded-lg border border-white/10 hover:bg-white/5 disabled:opacity-40"
+                >
+                  Next
+                </button>
+              </div>
+            </div>
           </div>
 
           {/* --- Live Audit Feed --- */}
@@ -15,6 +15,8 @@ function CompanyPage() {
   const [company, setCompany] = useState(null)
   const [applications, setApplications] = useState([]) 
   const [contacts, setContacts] = useState([])          
+  const [appsCursor, setAppsCursor] = useState(null)
+  const [contactsCursor, setContactsCursor] = useState(null)
   const [isLoading, setIsLoading] = useState(true)
   const [error, setError] = useState(null)
   
@@ -53,6 +55,8 @@ function CompanyPage() {
         setCompany(companyData)
         setApplications(appsData)
         setContacts(contactsData)
+        setAppsCursor(appsRes.headers.get('X-Next-Cursor'))
+        setContactsCursor(contactsRes.headers.get('X-Next-Cursor'))
       } catch (err) {
         setError(err.message)
       } finally {
@@ -63,22 +67,25 @@ function CompanyPage() {
   }, [id, token, logout])
 
   // --- Utility Refreshers ---
-  const refreshApplications = async () => {
-    const res = await fetch(`https://job-application-tracker-3n97.onrender.com/api/companies/${id}/applications`, {
+  // Called without a cursor they reload the first page; with one they append the next page
+  const refreshApplications = async (cursor = null) => {
+    const res = await fetch(`https://job-application-tracker-3n97.onrender.com/api/companies/${id}/applications` + (cursor ? `?cursor=${cursor}` : ''), {
       headers: { 'Authorization': `Bearer ${token}` }
     })
     if (res.status === 401) return logout();
     const data = await res.json()
-    setApplications(data)
+    setApplications(prev => cursor ? [...prev, ...data] : data)
+    setAppsCursor(res.headers.get('X-Next-Cursor'))
   }
 
-  const refreshContacts = async () => {
-    const res = await fetch(`https://job-application-tracker-3n97.onrender.com/api/companies/${id}/contacts`, {
+  const refreshContacts = async (cursor = null) => {
+    const res = await fetch(`https://job-application-tracker-3n97.onrender.com/api/companies/${id}/contacts` + (cursor ? `?cursor=${cursor}` : ''), {
       headers: { 'Authorization': `Bearer ${token}` }
     })
     if (res.status === 401) return logout();
     const data = await res.json()
-    setContacts(data)
+    setContacts(prev => cursor ? [...prev, ...data] : data)
+    setContactsCursor(res.headers.get('X-Next-Cursor'))
   }
 
   // --- Handlers ---
@@ -190,6 +197,11 @@ function CompanyPage() {
                   </div>
                 ))
               )}
+              {appsCursor && (
+                <button onClick={() => refreshApplications(appsCursor)} className="w-full py-2 bg-white/10 hover:bg-white/20 rounded-xl text-white text-sm font-semibold transition-all">
+                  Load more applications
+                </button>
+              )}
             </div>
           </div>
 
@@ -222,6 +234,11 @@ function CompanyPage() {
                   </div>
                 ))
               )}
+              {contactsCursor && (
+                <button onClick={() => refreshContacts(contactsCursor)} className="w-full py-2 bg-white/10 hover:bg-white/20 rounded-lg text-white text-xs font-semibold transition-all">
+                  Load more contacts
+                </button>
+              )}
             </div>
           </div>
         </div>
@@ -9,6 +9,7 @@ import DeleteConfirmModal from '../components/DeleteConfirmModal'
 
 function Home() {
   const [companies, setCompanies] = useState([])
+  const [nextCursor, setNextCursor] = useState(null)
   const [isLoading, setIsLoading] = useState(true)
   const [error, setError] = useState(null)
   const [searchQuery, setSearchQuery] = useState('')
@@ -19,13 +20,21 @@ function Home() {
 
   const { token, logout } = useAuth()
 
+  // Search runs on the server so it covers every page, not just the loaded
+  // ones; wait for a pause in typing before asking
   useEffect(() => {
-    fetchCompanies()
-  }, [token])
+    const timer = setTimeout(() => fetchCompanies(), searchQuery ? 300 : 0)
+    return () => clearTimeout(timer)
+  }, [token, searchQuery])
 
-  const fetchCompanies = async () => {
+  // Pass the X-Next-Cursor value to append the next page instead of reloading
+  const fetchCompanies = async (cursor = null) => {
     try {
-      const response = await fetch('https://job-application-tracker-3n97.onrender.com/api/companies', {
+      const params = new URLSearchParams()
+      if (searchQuery.trim()) params.set('q', searchQuery.trim())
+      if (cursor) params.set('cursor', cursor)
+      const url = `https://job-application-tracker-3n97.onrender.com/api/companies?${params}`
+      const response = await fetch(url, {
         headers: {
           'Authorization': `Bearer ${token}`,
           'Content-Type': 'application/json'
@@ -40,7 +49,8 @@ function Home() {
       if (!response.ok) throw new Error('Failed to connect to server')
       
       const data = await response.json()
-      setCompanies(data)
+      setCompanies(prev => cursor ? [...prev, ...data] : data)
+      setNextCursor(response.headers.get('X-Next-Cursor'))
       setIsLoading(false)
     } catch (err) {
       setError(err.message)
@@ -48,10 +58,6 @@ function Home() {
     }
   }
 
-  const filteredCompanies = companies.filter(company => 
-    company.name.toLowerCase().includes(searchQuery.toLowerCase())
-  )
-
   const handleCompanyAdded = () => {
     fetchCompanies()
   }
@@ -147,7 +153,7 @@ function Home() {
         {/* Content State */}
         {!isLoading && !error && (
           <>
-            {filteredCompanies.length === 0 ? (
+            {companies.length === 0 ? (
               <div className="bg-white/10 backdrop-blur-md border border-white/20 rounded-3xl p-12 text-center shadow-xl">
                 <div className="text-6xl mb-4">🚀</div>
                 <h3 className="text-xl font-bold text-white mb-2">
@@ -167,7 +173,7 @@ function Home() {
               </div>
             ) : (
               <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-8">
-                {filteredCompanies.map((company) => (
+                {companies.map((company) => (
                   <CompanyCard 
                     key={company.id} 
                     company={company} 
@@ -177,6 +183,16 @@ function Home() {
                 ))}
               </div>
             )}
+            {nextCursor && (
+              <div className="text-center mt-8">
+                <button
+                  onClick={() => fetchCompanies(nextCursor)}
+                  className="px-6 py-2 bg-white/10 hover:bg-white/20 border border-white/20 rounded-xl text-white text-sm font-semibold transition-all"
+                >
+                  Load more
+                </button>
+              </div>
+            )}
           </>
         )}
       </main>